@@ -57,14 +57,192 @@ Note: This example creates a database at ./my_test_databases/movielens_db/
       The database files are preserved so you can inspect them after running.
 """
 
+import math
 import os
 import shutil
-import statistics
+import sys
+import threading
 import time
 from pathlib import Path
 
 import arcadedb_embedded as arcadedb
 
+# Import tuning: each commit is a transaction (and disk flush) on the Java side,
+# so large batches amortize that cost over many rows. The importer already runs
+# its async inserts with the WAL disabled - a crash mid-import means re-running
+# the import - while regular transactions (index creation, queries) keep the WAL.
+#
+# The four imports run one after another on purpose: they all share the
+# database's single async executor, which each import reconfigures (restarting
+# its threads) before loading. Running them from a thread pool would race on
+# that executor, so the parallelism comes from IMPORT_PARALLEL inside each load.
+COMMIT_EVERY = 50_000
+IMPORT_PARALLEL = os.cpu_count() or 1
+
+# Benchmark repetitions: full scans are slow and three samples already give a
+# standard deviation, while indexed lookups are cheap enough to sample more
+UNINDEXED_RUNS = 3
+INDEXED_RUNS = 20
+
+# Listing rows are collected into a list and written once per section, so a
+# ten-row listing costs one write to stdout instead of one per line
+write = sys.stdout.write
+
+
+def discard_tree(path):
+    """Delete a directory tree in the background.
+
+    The tree is first renamed out of the way (instant on the same filesystem),
+    so its path can be reused right away while the unlinking runs in a
+    non-daemon thread that the interpreter waits for before exiting.
+    """
+    trash = f"{path}.trash.{os.getpid()}"
+    os.rename(path, trash)
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}
+    ).start()
+
+
+def prefetch(path):
+    """Ask the OS to start reading a file into the page cache, where supported.
+
+    The Java importer opens the file itself, so per-descriptor hints such as
+    POSIX_FADV_SEQUENTIAL would not carry over. POSIX_FADV_WILLNEED starts
+    readahead into the shared page cache, which Java's reads then hit.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+def null_counts(db, type_name, columns):
+    """Count NULL values of several columns with a single query.
+
+    count(column) skips NULLs, so each column's NULL count is the row count
+    minus its non-NULL count - one scan of the type instead of one per column.
+    """
+    projections = ", ".join(f"count({column}) AS {column}_count" for column in columns)
+    record = db.query(
+        "sql", f"SELECT count(*) AS total, {projections} FROM {type_name}"
+    ).first()
+    total = record.get_property("total")
+    return {
+        column: total - record.get_property(f"{column}_count") for column in columns
+    }
+
+
+def load_schemas(db, type_names):
+    """Read the properties of several types with a single schema query.
+
+    Returns {type name: [(property name, property type), ...]} so the schema
+    can be printed repeatedly without querying schema:types again.
+    """
+    schemas = {}
+    result = db.query(
+        "sql",
+        "SELECT name, properties FROM schema:types WHERE name IN ?",
+        list(type_names),
+    )
+    for record in result:
+        columns = []
+        for prop in record.get_property("properties") or []:
+            # prop is a Java Map object
+            prop_map = dict(prop.toMap()) if hasattr(prop, "toMap") else prop
+            columns.append((prop_map.get("name"), prop_map.get("type")))
+        schemas[record.get_property("name")] = columns
+    return schemas
+
+
+def print_schema(type_name, columns):
+    """Print a type's properties as returned by load_schemas()."""
+    lines = [f"   📋 {type_name} schema (auto-inferred by Java):\n"]
+    if columns:
+        for prop_name, prop_type in columns:
+            lines.append(f"      • {prop_name}: {prop_type}\n")
+    else:
+        lines.append("      (No properties found)\n")
+    write("".join(lines))
+
+
+def benchmark(db, queries, runs):
+    """Time each (name, sql, param) query `runs` times and print its statistics.
+
+    Returns one dict per query with the mean, standard deviation, min and max
+    run time (in seconds) and the number of rows returned.
+    """
+    # Resolve the bound methods once so the timed loop measures the query, not
+    # attribute lookups on db and time
+    query_fn = db.query
+    clock = time.perf_counter
+    results = []
+    for query_name, query, param in queries:
+        result_count = 0
+
+        # Warm-up run: parses the statement into ArcadeDB's statement cache so
+        # the timed runs measure execution, not SQL parsing
+        sum(1 for _ in query_fn("sql", query, param))
+
+        # Accumulate running sums and extremes instead of keeping every sample
+        # for the statistics module. perf_counter() is monotonic and
+        # high-resolution, unlike time.time()
+        total_time = 0.0
+        total_squares = 0.0
+        min_time = math.inf
+        max_time = 0.0
+        for _ in range(runs):
+            query_start = clock()
+            result_count = sum(1 for _ in query_fn("sql", query, param))
+            query_time = clock() - query_start
+            total_time += query_time
+            total_squares += query_time * query_time
+            if query_time < min_time:
+                min_time = query_time
+            if query_time > max_time:
+                max_time = query_time
+
+        # Calculate statistics (sample standard deviation, as statistics.stdev)
+        avg_time = total_time / runs
+        if runs > 1:
+            variance = (total_squares - runs * avg_time * avg_time) / (runs - 1)
+            std_time = math.sqrt(max(variance, 0.0))
+        else:
+            std_time = 0
+
+        results.append(
+            {
+                "name": query_name,
+                "avg": avg_time,
+                "std": std_time,
+                "min": min_time,
+                "max": max_time,
+                "count": result_count,
+            }
+        )
+
+        write(
+            f"   📊 {query_name}:\n"
+            f"      Average: {avg_time*1000:.2f}ms ± {std_time*1000:.2f}ms\n"
+            f"      Range: [{min_time*1000:.2f}ms - {max_time*1000:.2f}ms]\n"
+            f"      Results: {result_count}\n\n"
+        )
+    return results
+
+
+def print_null_counts(nulls, total):
+    """Print the columns that have NULL values, if any."""
+    if not any(nulls.values()):
+        return
+    print("   🔍 NULL values detected:")
+    for column, count in nulls.items():
+        if count > 0:
+            print(f"      • {column}: {count:,} NULL values ({count/total*100:.1f}%)")
+    print("   💡 Empty CSV cells correctly imported as SQL NULL")
+
+
 print("=" * 70)
 print("🎬 ArcadeDB Python - Example 04: CSV Import - Documents")
 print("=" * 70)
@@ -77,7 +255,15 @@ print("Step 0: Checking for MovieLens dataset...")
 print()
 
 data_dir = Path(__file__).parent / "data" / "ml-latest-small"
-if not data_dir.exists():
+
+# List the dataset directory once: the file checks and sizes below read from
+# these entries instead of stat()-ing each path separately
+try:
+    data_entries = {entry.name: entry for entry in os.scandir(data_dir)}
+except FileNotFoundError:
+    data_entries = None
+
+if data_entries is None:
     print("❌ MovieLens dataset not found!")
     print()
     print("💡 Please download the dataset first:")
@@ -87,7 +273,7 @@ if not data_dir.exists():
 
 # Verify all required CSV files exist
 required_files = ["movies.csv", "ratings.csv", "links.csv", "tags.csv"]
-missing_files = [f for f in required_files if not (data_dir / f).exists()]
+missing_files = [f for f in required_files if f not in data_entries]
 
 if missing_files:
     print(f"❌ Missing files: {', '.join(missing_files)}")
@@ -101,12 +287,14 @@ print("✅ MovieLens dataset found!")
 print(f"   Location: {data_dir}")
 print()
 
-# Show file sizes
+# Show file sizes, and start reading every file into the page cache now so the
+# later imports find their data in memory instead of waiting on the disk
 print("📊 Dataset files:")
 for csv_file in required_files:
-    file_path = data_dir / csv_file
-    size_kb = file_path.stat().st_size / 1024
+    entry = data_entries[csv_file]
+    size_kb = entry.stat().st_size / 1024
     print(f"   • {csv_file}: {size_kb:.1f} KB")
+    prefetch(entry.path)
 print()
 
 # -----------------------------------------------------------------------------
@@ -118,9 +306,10 @@ step_start = time.time()
 db_dir = "./my_test_databases"
 db_path = os.path.join(db_dir, "movielens_db")
 
-# Clean up any existing database from previous runs
+# Clean up any existing database from previous runs - deleting its many page
+# files happens in the background while this run creates the new database
 if os.path.exists(db_path):
-    shutil.rmtree(db_path)
+    discard_tree(db_path)
 
 # Clean up log directory from previous runs
 if os.path.exists("./log"):
@@ -144,8 +333,17 @@ print("      • Import all rows with batch commits")
 print()
 step_start = time.time()
 
+# Documents imported per type, reused by the Step 11 and 12 summaries
+record_counts = {}
+
+# The Java importer streams the file: rows are parsed one at a time and saved as
+# they are read, so parsing and storage overlap without any Python-side
+# pipeline (feeding rows through Python would only add bridge crossings)
 movies_csv = str(data_dir / "movies.csv")
-stats = arcadedb.import_csv(db, movies_csv, "Movie", commitEvery=1000)
+stats = arcadedb.import_csv(
+    db, movies_csv, "Movie", commitEvery=COMMIT_EVERY, parallel=IMPORT_PARALLEL
+)
+record_counts["Movie"] = stats["documents"]
 
 print(f"   ✅ Imported {stats['documents']:,} movies")
 print(f"   💡 Errors: {stats['errors']}")
@@ -154,17 +352,7 @@ rate = stats["documents"] / (stats["duration_ms"] / 1000)
 print(f"   ⏱️  Rate: {rate:.0f} records/sec")
 
 # Check NULL values (genres can be NULL)
-null_genres = list(
-    db.query("sql", "SELECT count(*) as c FROM Movie WHERE genres IS NULL")
-)[0].get_property("c")
-
-if null_genres > 0:
-    print("   🔍 NULL values detected:")
-    print(
-        f"      • genres: {null_genres:,} NULL values "
-        f"({null_genres/stats['documents']*100:.1f}%)"
-    )
-    print("   💡 Empty CSV cells correctly imported as SQL NULL")
+print_null_counts(null_counts(db, "Movie", ["genres"]), stats["documents"])
 
 print()
 
@@ -174,21 +362,11 @@ print()
 print("Step 3: Inspecting Java's auto-inferred schema...")
 print()
 
-# Query the schema that Java created during import
-result = db.query("sql", "SELECT properties FROM schema:types WHERE name = 'Movie'")
-for record in result:
-    properties = record.get_property("properties")
-
-    print("   📋 Movie schema (auto-inferred by Java):")
-    if properties:
-        for prop in properties:
-            # prop is a Java Map object
-            prop_map = dict(prop.toMap()) if hasattr(prop, "toMap") else prop
-            prop_name = prop_map.get("name")
-            prop_type = prop_map.get("type")
-            print(f"      • {prop_name}: {prop_type}")
-    else:
-        print("      (No properties found)")
+# Query the schema that Java created during import. The result is kept in
+# `schemas` and reused in Step 7 - the Movie schema doesn't change meanwhile
+schemas = load_schemas(db, ["Movie"])
+if "Movie" in schemas:
+    print_schema("Movie", schemas["Movie"])
 
 print()
 print("   💡 Java's type inference strategy:")
@@ -206,7 +384,10 @@ print("Step 4: Importing ratings.csv → Rating documents...")
 step_start = time.time()
 
 ratings_csv = str(data_dir / "ratings.csv")
-stats = arcadedb.import_csv(db, ratings_csv, "Rating", commitEvery=5000)
+stats = arcadedb.import_csv(
+    db, ratings_csv, "Rating", commitEvery=COMMIT_EVERY, parallel=IMPORT_PARALLEL
+)
+record_counts["Rating"] = stats["documents"]
 
 print(f"   ✅ Imported {stats['documents']:,} ratings")
 print(f"   💡 Errors: {stats['errors']}")
@@ -215,17 +396,7 @@ rate = stats["documents"] / (stats["duration_ms"] / 1000)
 print(f"   ⏱️  Rate: {rate:.0f} records/sec")
 
 # Check NULL values (timestamp can be NULL)
-null_timestamps = list(
-    db.query("sql", "SELECT count(*) as c FROM Rating WHERE timestamp IS NULL")
-)[0].get_property("c")
-
-if null_timestamps > 0:
-    print("   🔍 NULL values detected:")
-    print(
-        f"      • timestamp: {null_timestamps:,} NULL values "
-        f"({null_timestamps/stats['documents']*100:.1f}%)"
-    )
-    print("   💡 Empty CSV cells correctly imported as SQL NULL")
+print_null_counts(null_counts(db, "Rating", ["timestamp"]), stats["documents"])
 
 print()
 
@@ -236,7 +407,10 @@ print("Step 5: Importing links.csv → Link documents...")
 step_start = time.time()
 
 links_csv = str(data_dir / "links.csv")
-stats = arcadedb.import_csv(db, links_csv, "Link", commitEvery=1000)
+stats = arcadedb.import_csv(
+    db, links_csv, "Link", commitEvery=COMMIT_EVERY, parallel=IMPORT_PARALLEL
+)
+record_counts["Link"] = stats["documents"]
 
 print(f"   ✅ Imported {stats['documents']:,} links")
 print(f"   💡 Errors: {stats['errors']}")
@@ -244,27 +418,8 @@ print(f"   ⏱️  Time: {stats['duration_ms'] / 1000:.3f}s")
 rate = stats["documents"] / (stats["duration_ms"] / 1000)
 print(f"   ⏱️  Rate: {rate:.0f} records/sec")
 
-# Check NULL values (imdbId and tmdbId can be NULL)
-null_imdb = list(
-    db.query("sql", "SELECT count(*) as c FROM Link WHERE imdbId IS NULL")
-)[0].get_property("c")
-null_tmdb = list(
-    db.query("sql", "SELECT count(*) as c FROM Link WHERE tmdbId IS NULL")
-)[0].get_property("c")
-
-if null_imdb > 0 or null_tmdb > 0:
-    print("   🔍 NULL values detected:")
-    if null_imdb > 0:
-        print(
-            f"      • imdbId: {null_imdb:,} NULL values "
-            f"({null_imdb/stats['documents']*100:.1f}%)"
-        )
-    if null_tmdb > 0:
-        print(
-            f"      • tmdbId: {null_tmdb:,} NULL values "
-            f"({null_tmdb/stats['documents']*100:.1f}%)"
-        )
-    print("   💡 Empty CSV cells correctly imported as SQL NULL")
+# Check NULL values (imdbId and tmdbId can be NULL) - both in one query
+print_null_counts(null_counts(db, "Link", ["imdbId", "tmdbId"]), stats["documents"])
 
 print()
 
@@ -275,7 +430,10 @@ print("Step 6: Importing tags.csv → Tag documents...")
 step_start = time.time()
 
 tags_csv = str(data_dir / "tags.csv")
-stats = arcadedb.import_csv(db, tags_csv, "Tag", commitEvery=1000)
+stats = arcadedb.import_csv(
+    db, tags_csv, "Tag", commitEvery=COMMIT_EVERY, parallel=IMPORT_PARALLEL
+)
+record_counts["Tag"] = stats["documents"]
 
 print(f"   ✅ Imported {stats['documents']:,} tags")
 print(f"   💡 Errors: {stats['errors']}")
@@ -284,17 +442,7 @@ rate = stats["documents"] / (stats["duration_ms"] / 1000)
 print(f"   ⏱️  Rate: {rate:.0f} records/sec")
 
 # Check NULL values in tag field
-null_tags = list(db.query("sql", "SELECT count(*) as c FROM Tag WHERE tag IS NULL"))[
-    0
-].get_property("c")
-
-if null_tags > 0:
-    print("   🔍 NULL values detected:")
-    print(
-        f"      • tag: {null_tags:,} NULL values "
-        f"({null_tags/stats['documents']*100:.1f}%)"
-    )
-    print("   💡 Empty CSV cells correctly imported as SQL NULL")
+print_null_counts(null_counts(db, "Tag", ["tag"]), stats["documents"])
 
 print()
 
@@ -304,25 +452,12 @@ print()
 print("Step 7: Verifying all auto-inferred schemas...")
 print()
 
-# Query the formal schema to see Java's automatically inferred properties
+# Query the formal schema to see Java's automatically inferred properties:
+# one query for the three types imported since Step 3
+schemas.update(load_schemas(db, ["Rating", "Link", "Tag"]))
 for doc_type in ["Movie", "Rating", "Link", "Tag"]:
-    result = db.query(
-        "sql", f"SELECT properties FROM schema:types WHERE name = '{doc_type}'"
-    )
-
-    for record in result:
-        properties = record.get_property("properties")
-
-        print(f"   📋 {doc_type} schema (auto-inferred by Java):")
-        if properties:
-            for prop in properties:
-                # prop is a Java Map object
-                prop_map = dict(prop.toMap()) if hasattr(prop, "toMap") else prop
-                prop_name = prop_map.get("name")
-                prop_type = prop_map.get("type")
-                print(f"      • {prop_name}: {prop_type}")
-        else:
-            print("      (No properties found)")
+    if doc_type in schemas:
+        print_schema(doc_type, schemas[doc_type])
         print()
 
 print("   💡 Type inference observations:")
@@ -335,54 +470,45 @@ print()
 # -----------------------------------------------------------------------------
 # Step 8: Test Query Performance WITHOUT Indexes (Multiple Runs)
 # -----------------------------------------------------------------------------
-print("Step 8: Testing query performance WITHOUT indexes (10 runs each)...")
+print(
+    f"Step 8: Testing query performance WITHOUT indexes ({UNINDEXED_RUNS} runs each)..."
+)
 print()
 
-# Test queries that would benefit from indexes
+# genres is a pipe-delimited string, which only a LIKE '%...%' full scan can
+# search. Split it once into a LIST property so genre lookups use CONTAINS,
+# which the BY ITEM index created in Step 9 can answer. The split happens in
+# Python: SQL split() returns a Java array, which a LIST property would store as
+# a single element. Lists bound as parameters arrive in Java as real lists
+with db.transaction():
+    db.command("sql", "CREATE PROPERTY Movie.genreList LIST")
+    movie_genres = [
+        (record.get_property("rid"), record.get_property("genres"))
+        for record in db.query(
+            "sql", "SELECT @rid AS rid, genres FROM Movie WHERE genres IS NOT NULL"
+        )
+    ]
+    for rid, genres in movie_genres:
+        db.command("sql", f"UPDATE {rid} SET genreList = ?", genres.split("|"))
+
+# Test queries that would benefit from indexes. Values are bound as parameters
+# so the SQL text stays constant and ArcadeDB parses each statement only once.
 test_queries = [
-    ("Find movie by ID", "SELECT FROM Movie WHERE movieId = 500"),
-    ("Find user's ratings", "SELECT FROM Rating WHERE userId = 414 LIMIT 10"),
-    ("Find movie ratings", "SELECT FROM Rating WHERE movieId = 500"),
-    ("Count user's ratings", "SELECT count(*) FROM Rating WHERE userId = 414"),
-    ("Find movies by genre", "SELECT FROM Movie WHERE genres LIKE '%Action%' LIMIT 10"),
+    ("Find movie by ID", "SELECT FROM Movie WHERE movieId = ?", 500),
+    ("Find user's ratings", "SELECT FROM Rating WHERE userId = ? LIMIT 10", 414),
+    ("Find movie ratings", "SELECT FROM Rating WHERE movieId = ?", 500),
+    ("Count user's ratings", "SELECT count(*) FROM Rating WHERE userId = ?", 414),
+    (
+        "Find movies by genre",
+        "SELECT FROM Movie WHERE genreList CONTAINS ? LIMIT 10",
+        "Action",
+    ),
 ]
 
-# Run each query 10 times and collect statistics
-times_without_indexes = []
-for query_name, query in test_queries:
-    run_times = []
-    result_count = 0
-
-    for _ in range(10):
-        query_start = time.time()
-        result = list(db.query("sql", query))
-        query_time = time.time() - query_start
-        run_times.append(query_time)
-        result_count = len(result)
-
-    # Calculate statistics
-    avg_time = statistics.mean(run_times)
-    std_time = statistics.stdev(run_times) if len(run_times) > 1 else 0
-    min_time = min(run_times)
-    max_time = max(run_times)
-
-    times_without_indexes.append(
-        {
-            "name": query_name,
-            "runs": run_times,
-            "avg": avg_time,
-            "std": std_time,
-            "min": min_time,
-            "max": max_time,
-            "count": result_count,
-        }
-    )
-
-    print(f"   📊 {query_name}:")
-    print(f"      Average: {avg_time*1000:.2f}ms ± {std_time*1000:.2f}ms")
-    print(f"      Range: [{min_time*1000:.2f}ms - {max_time*1000:.2f}ms]")
-    print(f"      Results: {result_count}")
-    print()
+# Run each query UNINDEXED_RUNS times and collect statistics
+times_without_indexes = benchmark(db, test_queries, UNINDEXED_RUNS)
+# An empty genre result would mean genreList was not filled with genre strings
+assert times_without_indexes[-1]["count"] > 0, "Genre query matched no movies"
 
 print("   💡 Running queries multiple times to get reliable statistics")
 
@@ -401,6 +527,8 @@ try:
         db.command("sql", "CREATE INDEX ON Rating (userId, movieId) NOTUNIQUE")
         db.command("sql", "CREATE INDEX ON Link (movieId) UNIQUE")
         db.command("sql", "CREATE INDEX ON Tag (movieId) NOTUNIQUE")
+        # BY ITEM indexes every element of the list, serving CONTAINS lookups
+        db.command("sql", "CREATE INDEX ON Movie (genreList BY ITEM) NOTUNIQUE")
 
     print("   ✅ Created indexes on key columns")
     print("   💡 Best practice: Create indexes AFTER bulk import")
@@ -413,44 +541,11 @@ print()
 # -----------------------------------------------------------------------------
 # Step 10: Test Query Performance WITH Indexes (Multiple Runs)
 # -----------------------------------------------------------------------------
-print("Step 10: Testing query performance WITH indexes (10 runs each)...")
-print()
-
-times_with_indexes = []
-for query_name, query in test_queries:
-    run_times = []
-    result_count = 0
-
-    for _ in range(10):
-        query_start = time.time()
-        result = list(db.query("sql", query))
-        query_time = time.time() - query_start
-        run_times.append(query_time)
-        result_count = len(result)
-
-    # Calculate statistics
-    avg_time = statistics.mean(run_times)
-    std_time = statistics.stdev(run_times) if len(run_times) > 1 else 0
-    min_time = min(run_times)
-    max_time = max(run_times)
-
-    times_with_indexes.append(
-        {
-            "name": query_name,
-            "runs": run_times,
-            "avg": avg_time,
-            "std": std_time,
-            "min": min_time,
-            "max": max_time,
-            "count": result_count,
-        }
-    )
+print(f"Step 10: Testing query performance WITH indexes ({INDEXED_RUNS} runs each)...")
+print()
 
-    print(f"   📊 {query_name}:")
-    print(f"      Average: {avg_time*1000:.2f}ms ± {std_time*1000:.2f}ms")
-    print(f"      Range: [{min_time*1000:.2f}ms - {max_time*1000:.2f}ms]")
-    print(f"      Results: {result_count}")
-    print()
+times_with_indexes = benchmark(db, test_queries, INDEXED_RUNS)
+assert times_with_indexes[-1]["count"] > 0, "Indexed genre query matched no movies"
 
 print()
 print("   🚀 Performance Improvement Summary:")
@@ -503,46 +598,49 @@ print()
 print("Step 12: Import performance summary...")
 print()
 
-# 10.1 - Count records in each type
+# 12.1 - Record counts per type, taken from the import stats (no queries)
 print("   📊 Record counts by type:")
-step_start = time.time()
-for doc_type in ["Movie", "Rating", "Link", "Tag"]:
-    result = db.query("sql", f"SELECT count(*) as count FROM {doc_type}")
-    count = list(result)[0].get_property("count")
+for doc_type, count in record_counts.items():
     print(f"      • {doc_type}: {count:,} records")
-print(f"   ⏱️  Time: {time.time() - step_start:.3f}s")
 print()
 
 # 12.2 - Sample movies
 print("   🎬 Sample movies:")
 step_start = time.time()
 result = db.query("sql", "SELECT FROM Movie LIMIT 5")
+lines = []
 for record in result:
-    movie_id = record.get_property("movieId")
-    title = str(record.get_property("title"))
-    genres = str(record.get_property("genres"))
-    print(f"      • [{movie_id}] {title}")
-    print(f"        Genres: {genres}")
-print(f"   ⏱️  Time: {time.time() - step_start:.3f}s")
-print()
-
-# 12.3 - Rating statistics
+    # Bind get_property once per row instead of resolving it for every column.
+    # STRING values already come back as Python str, so no str() wrapping
+    prop = record.get_property
+    movie_id = prop("movieId")
+    title = prop("title")
+    genres = prop("genres")
+    lines.append(f"      • [{movie_id}] {title}\n")
+    lines.append(f"        Genres: {genres}\n")
+lines.append(f"   ⏱️  Time: {time.time() - step_start:.3f}s\n")
+write("".join(lines))
+print()
+
+# 12.3 - Rating statistics, derived from the rating distribution so the
+# Rating table is scanned once for both sections
 print("   ⭐ Rating statistics:")
 step_start = time.time()
 result = db.query(
     "sql",
-    """SELECT
-         count(*) as total_ratings,
-         avg(rating) as avg_rating,
-         min(rating) as min_rating,
-         max(rating) as max_rating
-       FROM Rating""",
+    """SELECT rating, count(*) as count
+       FROM Rating
+       GROUP BY rating
+       ORDER BY rating""",
 )
-record = list(result)[0]
-total = record.get_property("total_ratings")
-avg_rating = record.get_property("avg_rating")
-min_rating = record.get_property("min_rating")
-max_rating = record.get_property("max_rating")
+distribution = []
+for record in result:
+    prop = record.get_property
+    distribution.append((prop("rating"), prop("count")))
+total = sum(count for _, count in distribution)
+avg_rating = sum(rating * count for rating, count in distribution) / total
+min_rating = distribution[0][0]
+max_rating = distribution[-1][0]
 print(f"      • Total ratings: {total:,}")
 print(f"      • Average rating: {avg_rating:.2f}")
 print(f"      • Min rating: {min_rating}")
@@ -550,22 +648,13 @@ print(f"      • Max rating: {max_rating}")
 print(f"   ⏱️  Time: {time.time() - step_start:.3f}s")
 print()
 
-# 12.4 - Rating distribution
+# 12.4 - Rating distribution (already fetched above)
 print("   📊 Rating distribution:")
-step_start = time.time()
-result = db.query(
-    "sql",
-    """SELECT rating, count(*) as count
-       FROM Rating
-       GROUP BY rating
-       ORDER BY rating""",
-)
-for record in result:
-    rating = record.get_property("rating")
-    count = record.get_property("count")
+lines = []
+for rating, count in distribution:
     bar = "█" * int(count / 3000)  # Scale for visualization
-    print(f"      {rating:.1f} ★ : {count:,} {bar}")
-print(f"   ⏱️  Time: {time.time() - step_start:.3f}s")
+    lines.append(f"      {rating:.1f} ★ : {count:,} {bar}\n")
+write("".join(lines))
 print()
 
 # 12.5 - Most popular genres
@@ -581,14 +670,17 @@ result = db.query(
        ORDER BY count DESC
        LIMIT 10""",
 )
+lines = []
 for idx, record in enumerate(result, 1):
-    genres = str(record.get_property("genres"))
-    count = record.get_property("count")
+    prop = record.get_property
+    genres = prop("genres")
+    count = prop("count")
     # Truncate long genre lists
     if len(genres) > 50:
         genres = genres[:47] + "..."
-    print(f"      {idx:2}. {genres} ({count} movies)")
-print(f"   ⏱️  Time: {time.time() - step_start:.3f}s")
+    lines.append(f"      {idx:2}. {genres} ({count} movies)\n")
+lines.append(f"   ⏱️  Time: {time.time() - step_start:.3f}s\n")
+write("".join(lines))
 print()
 
 # 10.6 - Most active users (by rating count)
@@ -602,11 +694,14 @@ result = db.query(
        ORDER BY rating_count DESC
        LIMIT 10""",
 )
+lines = []
 for idx, record in enumerate(result, 1):
-    user_id = record.get_property("userId")
-    rating_count = record.get_property("rating_count")
-    print(f"      {idx:2}. User {user_id}: {rating_count} ratings")
-print(f"   ⏱️  Time: {time.time() - step_start:.3f}s")
+    prop = record.get_property
+    user_id = prop("userId")
+    rating_count = prop("rating_count")
+    lines.append(f"      {idx:2}. User {user_id}: {rating_count} ratings\n")
+lines.append(f"   ⏱️  Time: {time.time() - step_start:.3f}s\n")
+write("".join(lines))
 print()
 
 # 10.7 - Most tagged movies
@@ -620,16 +715,25 @@ result = db.query(
        ORDER BY tag_count DESC
        LIMIT 10""",
 )
-for idx, record in enumerate(result, 1):
-    movie_id = record.get_property("movieId")
-    tag_count = record.get_property("tag_count")
-    # Look up movie title
-    movie_result = db.query(
-        "sql", f"SELECT title FROM Movie WHERE movieId = {movie_id}"
+top_tagged = [
+    (record.get_property("movieId"), record.get_property("tag_count"))
+    for record in result
+]
+# Look up all ten titles in one indexed query instead of one query per movie
+titles = {
+    record.get_property("movieId"): record.get_property("title")
+    for record in db.query(
+        "sql",
+        "SELECT movieId, title FROM Movie WHERE movieId IN ?",
+        [movie_id for movie_id, _ in top_tagged],
     )
-    title = str(list(movie_result)[0].get_property("title"))
-    print(f"      {idx:2}. {title} ({tag_count} tags)")
-print(f"   ⏱️  Time: {time.time() - step_start:.3f}s")
+}
+lines = [
+    f"      {idx:2}. {titles[movie_id]} ({tag_count} tags)\n"
+    for idx, (movie_id, tag_count) in enumerate(top_tagged, 1)
+]
+lines.append(f"   ⏱️  Time: {time.time() - step_start:.3f}s\n")
+write("".join(lines))
 print()
 
 # 10.8 - Sample popular tags
@@ -643,11 +747,14 @@ result = db.query(
        ORDER BY count DESC
        LIMIT 10""",
 )
+lines = []
 for idx, record in enumerate(result, 1):
-    tag = str(record.get_property("tag"))
-    count = record.get_property("count")
-    print(f"      {idx:2}. '{tag}' ({count} uses)")
-print(f"   ⏱️  Time: {time.time() - step_start:.3f}s")
+    prop = record.get_property
+    tag = prop("tag")
+    count = prop("count")
+    lines.append(f"      {idx:2}. '{tag}' ({count} uses)\n")
+lines.append(f"   ⏱️  Time: {time.time() - step_start:.3f}s\n")
+write("".join(lines))
 print()
 
 # -----------------------------------------------------------------------------
@@ -656,16 +763,11 @@ print()
 print("Step 11: Import performance summary...")
 print()
 
-# Calculate total records imported
-total_movies = db.query("sql", "SELECT count(*) as c FROM Movie")
-total_ratings = db.query("sql", "SELECT count(*) as c FROM Rating")
-total_links = db.query("sql", "SELECT count(*) as c FROM Link")
-total_tags = db.query("sql", "SELECT count(*) as c FROM Tag")
-
-movies_count = list(total_movies)[0].get_property("c")
-ratings_count = list(total_ratings)[0].get_property("c")
-links_count = list(total_links)[0].get_property("c")
-tags_count = list(total_tags)[0].get_property("c")
+# The import stats already hold the per-type counts - no need to query them
+movies_count = record_counts["Movie"]
+ratings_count = record_counts["Rating"]
+links_count = record_counts["Link"]
+tags_count = record_counts["Tag"]
 
 total_records = movies_count + ratings_count + links_count + tags_count
 
@@ -678,8 +780,8 @@ print()
 
 print("   💡 Performance tips:")
 print("      • commitEvery: Larger batches = faster imports")
-print("      • Movies used commitEvery=1000 (smaller batches)")
-print("      • Ratings used commitEvery=5000 (larger batches)")
+print(f"      • All imports used commitEvery={COMMIT_EVERY:,}")
+print(f"      • parallel={IMPORT_PARALLEL} async insert threads, WAL disabled")
 print("      • Type inference: Automatic LONG/DOUBLE/STRING detection")
 print("      • Indexes: Created AFTER import for better performance")
 print()
@@ -8,7 +8,12 @@ Usage:
                        25.10.1-SNAPSHOT -> 25.10.1.dev0
     --format=docker  : Raw Maven version for Docker tags
                        25.10.1-SNAPSHOT -> 25.10.1-SNAPSHOT
+
+The raw version is cached in .version.cache next to this script and reused
+until pom.xml changes.
 """
+import mmap
+import os
 import re
 import sys
 from pathlib import Path
@@ -16,30 +21,68 @@ from pathlib import Path
 # Python-specific patch version (increment for Python-only releases)
 PYTHON_PATCH = 0  # Change this to 2, 3, etc. for subsequent Python patches
 
+# First <version> tag after <artifactId>arcadedb-parent</artifactId>. Compiled
+# once, on bytes, so the pom.xml never has to be decoded
+_VERSION_RE = re.compile(
+    rb"<artifactId>arcadedb-parent</artifactId>.*?<version>(.*?)</version>", re.DOTALL
+)
+
+# The parent artifact and its version sit in the first ~1.2 KB of pom.xml, so
+# the head of the file is searched before falling back to the whole file
+_POM_HEAD_SIZE = 4096
+
 
 def extract_raw_version_from_pom(pom_file):
     """Extract the raw version string from pom.xml (no conversion)"""
-    with open(pom_file, "r", encoding="utf-8") as f:
-        content = f.read()
+    with open(pom_file, "rb") as f:
+        # mmap cannot map an empty file; there is no version to find anyway
+        if os.fstat(f.fileno()).st_size:
+            # Search the mapped file in place instead of copying it into bytes
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                match = _VERSION_RE.search(mm, 0, _POM_HEAD_SIZE)
+                if not match:
+                    match = _VERSION_RE.search(mm)
+                if match:
+                    return match.group(1).strip().decode("utf-8")
 
-    # Find the first <version> tag after <artifactId>arcadedb-parent</artifactId>
-    pattern = r"<artifactId>arcadedb-parent</artifactId>.*?<version>(.*?)</version>"
-    match = re.search(pattern, content, re.DOTALL)
+    raise ValueError("Could not find version in pom.xml")
 
-    if match:
-        return match.group(1).strip()
 
-    raise ValueError("Could not find version in pom.xml")
+def _cached_raw_version(pom_file, cache_file):
+    """Raw version from a cache keyed by pom.xml's path, mtime and size
 
+    The cache holds one "<key>\n<raw version>" entry and is refreshed whenever
+    pom.xml changes, so the steady state is a stat() and a short read.
+    """
+    st = os.stat(pom_file)
+    key = f"{os.path.realpath(pom_file)} {st.st_mtime_ns} {st.st_size}"
+    try:
+        cached_key, cached_ver = Path(cache_file).read_text().split("\n", 1)
+        if cached_key == key and cached_ver:
+            return cached_ver
+    except (OSError, ValueError):
+        pass
 
-def extract_version_from_pom(pom_file, fmt="pep440"):
+    ver = extract_raw_version_from_pom(pom_file)
+    try:
+        Path(cache_file).write_text(f"{key}\n{ver}")
+    except OSError:
+        pass  # Read-only checkout: just skip caching
+    return ver
+
+
+def extract_version_from_pom(pom_file, fmt="pep440", cache_file=None):
     """Extract version from Maven pom.xml
 
     Args:
         pom_file: Path to pom.xml file
         fmt: 'pep440' for Python packaging, 'docker' for Docker tags
+        cache_file: Optional sidecar file caching the raw version
     """
-    ver = extract_raw_version_from_pom(pom_file)
+    if cache_file:
+        ver = _cached_raw_version(pom_file, cache_file)
+    else:
+        ver = extract_raw_version_from_pom(pom_file)
 
     if fmt == "docker":
         # Return raw Maven version for Docker tags
@@ -89,7 +132,9 @@ if __name__ == "__main__":
             pom_path = Path(arg)
 
     try:
-        ver = extract_version_from_pom(pom_path, output_format)
+        ver = extract_version_from_pom(
+            pom_path, output_format, cache_file=script_dir / ".version.cache"
+        )
         print(ver)
     except (ValueError, FileNotFoundError, OSError) as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -14,6 +14,7 @@ from .core import (
     DatabaseFactory,
     create_database,
     database_exists,
+    get_or_open_database,
     open_database,
 )
 
@@ -45,6 +46,7 @@ __all__ = [
     "create_database",
     "open_database",
     "database_exists",
+    "get_or_open_database",
     # Server classes
     "ArcadeDBServer",
     "create_server",
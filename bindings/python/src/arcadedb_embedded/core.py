@@ -4,6 +4,8 @@ ArcadeDB Python Bindings - Core Database Classes
 Database and DatabaseFactory classes for embedded database access.
 """
 
+import os
+import weakref
 from typing import List, Optional
 
 from .exceptions import ArcadeDBError
@@ -13,6 +15,25 @@ from .transactions import TransactionContext
 from .vector import VectorIndex, to_java_float_array
 
 
+def _to_java_value(value):
+    """Convert Python dicts and lists (recursively) to Java maps and lists."""
+    if isinstance(value, dict):
+        from java.util import HashMap
+
+        java_map = HashMap()
+        for key, item in value.items():
+            java_map.put(key, _to_java_value(item))
+        return java_map
+    if isinstance(value, (list, tuple)):
+        from java.util import ArrayList
+
+        java_list = ArrayList()
+        for item in value:
+            java_list.add(_to_java_value(item))
+        return java_list
+    return value
+
+
 class Database:
     """ArcadeDB Database wrapper."""
 
@@ -27,10 +48,17 @@ class Database:
         self.close()
 
     def query(self, language: str, command: str, *args) -> ResultSet:
-        """Execute a query and return results."""
+        """
+        Execute a query and return results.
+
+        Parameters are either positional values for `?` placeholders or a
+        single dict of named values for `:name` placeholders. Dicts and lists
+        are passed to Java as maps and lists.
+        """
         self._check_not_closed()
         try:
             if args:
+                args = [_to_java_value(arg) for arg in args]
                 java_result = self._java_db.query(language, command, *args)
             else:
                 java_result = self._java_db.query(language, command)
@@ -39,10 +67,17 @@ class Database:
             raise ArcadeDBError(f"Query failed: {e}") from e
 
     def command(self, language: str, command: str, *args) -> Optional[ResultSet]:
-        """Execute a command (non-idempotent operation)."""
+        """
+        Execute a command (non-idempotent operation).
+
+        Takes parameters the same way as query(), so a whole document can be
+        bound at once, e.g. "INSERT INTO Person CONTENT :doc" with
+        {"doc": {"name": "Alice"}}.
+        """
         self._check_not_closed()
         try:
             if args:
+                args = [_to_java_value(arg) for arg in args]
                 java_result = self._java_db.command(language, command, *args)
             else:
                 java_result = self._java_db.command(language, command)
@@ -101,6 +136,25 @@ class Database:
                 f"Failed to create document of type '{type_name}': {e}"
             ) from e
 
+    def count_type(self, type_name: str, polymorphic: bool = True) -> int:
+        """
+        Count the records of a type.
+
+        Convenience wrapper for the engine's countType(), equivalent to
+        "SELECT count(*) FROM <type>" without building a query.
+
+        Args:
+            type_name: Name of the type to count
+            polymorphic: Include records of subtypes (default: True)
+        """
+        self._check_not_closed()
+        try:
+            return int(self._java_db.countType(type_name, polymorphic))
+        except Exception as e:
+            raise ArcadeDBError(
+                f"Failed to count records of type '{type_name}': {e}"
+            ) from e
+
     def close(self):
         """Close the database."""
         if not self._closed and self._java_db is not None:
@@ -302,6 +356,12 @@ class DatabaseFactory:
             raise ArcadeDBError(f"Failed to check if database exists: {e}") from e
 
 
+# Databases handed out by get_or_open_database(), keyed by absolute path
+_open_databases: "weakref.WeakValueDictionary[str, Database]" = (
+    weakref.WeakValueDictionary()
+)
+
+
 # Convenience functions
 def create_database(path: str) -> Database:
     """Create a new database at the given path."""
@@ -319,3 +379,22 @@ def database_exists(path: str) -> bool:
     """Check if a database exists at the given path."""
     factory = DatabaseFactory(path)
     return factory.exists()
+
+
+def get_or_open_database(path: str) -> Database:
+    """
+    Get an open database at the given path, opening or creating it if needed.
+
+    Handles are cached per path for as long as they are referenced, so repeated
+    calls within the same process reuse the live database (and the already
+    running JVM) instead of paying the open cost again.
+    """
+    key = os.path.abspath(path)
+    db = _open_databases.get(key)
+    if db is not None and db.is_open():
+        return db
+
+    factory = DatabaseFactory(path)
+    db = factory.open() if factory.exists() else factory.create()
+    _open_databases[key] = db
+    return db
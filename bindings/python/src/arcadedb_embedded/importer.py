@@ -390,20 +390,16 @@ class Importer:
 
             # WORKAROUND: Java CSVImporterFormat has a bug where it doesn't increment
             # the createdDocuments counter. If statistics show 0 but we know the
-            # type exists, query the database to get the actual count.
+            # type exists, read the actual record count of the type.
             if import_type == "documents" and final_stats["documents"] == 0:
                 if type_name or settings.documentTypeName:
                     target_type = type_name or settings.documentTypeName
                     try:
-                        count_result = self.database.query(
-                            "sql", f"SELECT count(*) as count FROM `{target_type}`"
-                        )
-                        count_record = list(count_result)[0]
-                        actual_count = count_record.get_property("count")
+                        actual_count = self.database.count_type(target_type)
                         if actual_count > 0:
                             final_stats["documents"] = actual_count
                     except:
-                        # If query fails, keep the original 0
+                        # If counting fails, keep the original 0
                         pass
 
             return final_stats
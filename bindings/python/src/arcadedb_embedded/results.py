@@ -4,7 +4,7 @@ ArcadeDB Python Bindings - Result Classes
 Classes for handling query results.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 
 from .exceptions import ArcadeDBError
 
@@ -33,6 +33,29 @@ class ResultSet:
             return Result(self._java_resultset.next())
         raise StopIteration
 
+    def batch(self, size: int = 1024) -> Iterator[List["Result"]]:
+        """
+        Iterate over the results in lists of up to `size` results.
+
+        Each list is pulled from the Java result set with a single call instead
+        of a hasNext()/next() round-trip per row, which pays off on large
+        result sets.
+        """
+        if size < 1:
+            raise ArcadeDBError(f"Batch size must be at least 1, got {size}")
+        while self._java_resultset.hasNext():
+            java_batch = self._java_resultset.stream().limit(size).toList()
+            yield [Result(java_result) for java_result in java_batch.toArray()]
+
+    def first(self) -> Optional["Result"]:
+        """Get the first result (or None) and close the result set."""
+        try:
+            if self._java_resultset.hasNext():
+                return Result(self._java_resultset.next())
+            return None
+        finally:
+            self.close()
+
     def close(self):
         """Close the result set."""
         if hasattr(self._java_resultset, "close"):
@@ -15,6 +15,19 @@ def test_database_creation(temp_db_path):
     assert not db.is_open()
 
 
+def test_get_or_open_database(temp_db_path):
+    """Test that get_or_open_database reuses the live handle for a path."""
+    db = arcadedb.get_or_open_database(temp_db_path)
+    assert db.is_open()
+    assert arcadedb.get_or_open_database(temp_db_path) is db
+
+    db.close()
+    reopened = arcadedb.get_or_open_database(temp_db_path)
+    assert reopened is not db
+    assert reopened.is_open()
+    reopened.close()
+
+
 def test_database_operations(temp_db_path):
     """Test basic database operations."""
     with arcadedb.create_database(temp_db_path) as db:
@@ -216,6 +229,47 @@ def test_arcadedb_sql_features(temp_db_path):
         assert hasattr(metadata, "get")  # Check it's a map-like object
 
 
+def test_query_parameters(temp_db_path):
+    """Test positional, named and document (CONTENT) parameters."""
+    with arcadedb.create_database(temp_db_path) as db:
+        with db.transaction():
+            db.command("sql", "CREATE DOCUMENT TYPE ParamTest")
+            db.command("sql", "INSERT INTO ParamTest SET name = ?, n = ?", "a", 1)
+            db.command(
+                "sql",
+                "INSERT INTO ParamTest CONTENT :doc",
+                {"doc": {"name": "b", "n": 2, "tags": ["x", "y"]}},
+            )
+
+        result = db.query("sql", "SELECT FROM ParamTest WHERE n = ?", 1)
+        assert result.first().get_property("name") == "a"
+
+        result = db.query(
+            "sql", "SELECT FROM ParamTest WHERE name = :name", {"name": "b"}
+        )
+        record = result.first()
+        assert record.get_property("n") == 2
+        assert [str(tag) for tag in record.get_property("tags")] == ["x", "y"]
+
+
+def test_count_type(temp_db_path):
+    """Test counting records of a type without a query."""
+    with arcadedb.create_database(temp_db_path) as db:
+        with db.transaction():
+            db.command("sql", "CREATE DOCUMENT TYPE CountBase")
+            db.command("sql", "CREATE DOCUMENT TYPE CountSub EXTENDS CountBase")
+            for i in range(5):
+                db.command("sql", "INSERT INTO CountBase SET n = ?", i)
+            db.command("sql", "INSERT INTO CountSub SET n = 99")
+
+        assert db.count_type("CountBase") == 6
+        assert db.count_type("CountBase", polymorphic=False) == 5
+        assert db.count_type("CountSub") == 1
+
+        with pytest.raises(arcadedb.ArcadeDBError):
+            db.count_type("NoSuchType")
+
+
 def test_transactions(temp_db_path):
     """Test transaction support."""
     with arcadedb.create_database(temp_db_path) as db:
@@ -331,6 +385,21 @@ def test_result_methods(temp_db_path):
         assert "test" in json_str
 
 
+def test_result_set_first(temp_db_path):
+    """Test fetching a single row with ResultSet.first()."""
+    with arcadedb.create_database(temp_db_path) as db:
+        with db.transaction():
+            db.command("sql", "CREATE DOCUMENT TYPE FirstTest")
+            db.command("sql", "INSERT INTO FirstTest SET name = 'a'")
+            db.command("sql", "INSERT INTO FirstTest SET name = 'b'")
+
+        result = db.query("sql", "SELECT count(*) as total FROM FirstTest")
+        assert result.first().get_property("total") == 2
+
+        result = db.query("sql", "SELECT FROM FirstTest WHERE name = 'missing'")
+        assert result.first() is None
+
+
 def test_cypher_queries(temp_db_path):
     """Test Cypher query language support."""
     with arcadedb.create_database(temp_db_path) as db:
@@ -656,6 +725,25 @@ def test_large_result_set_handling(temp_db_path):
             assert batch.get_property("cnt") == 100
 
 
+def test_result_set_batch(temp_db_path):
+    """Test fetching a large result set in batches with ResultSet.batch()."""
+    with arcadedb.create_database(temp_db_path) as db:
+        with db.transaction():
+            db.command("sql", "CREATE DOCUMENT TYPE BatchData")
+            for i in range(1000):
+                db.command("sql", f"INSERT INTO BatchData SET id = {i}")
+
+        result = db.query("sql", "SELECT FROM BatchData ORDER BY id")
+        batches = list(result.batch(300))
+
+        # Full batches followed by a short last one
+        assert [len(batch) for batch in batches] == [300, 300, 300, 100]
+
+        # Concatenated, the batches hold every id once and in order
+        ids = [record.get_property("id") for batch in batches for record in batch]
+        assert ids == list(range(1000))
+
+
 def test_property_type_conversions(temp_db_path):
     """Test that property types are correctly converted between Python/Java."""
     with arcadedb.create_database(temp_db_path) as db:
@@ -14,6 +14,8 @@ import os
 import shutil
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import arcadedb_embedded as arcadedb
 import pytest
@@ -46,15 +48,20 @@ def cleanup_test_dirs():
         except Exception:
             pass
 
-    # Give servers time to release locks
-    time.sleep(0.5)
-
-    for path in dirs:
-        if os.path.exists(path):
+    def _remove(path):
+        # Retry briefly instead of a fixed sleep while servers release locks
+        for _ in range(10):
             try:
-                shutil.rmtree(path, ignore_errors=True)
-            except Exception:
-                pass
+                shutil.rmtree(path)
+                return
+            except FileNotFoundError:
+                return
+            except OSError:
+                time.sleep(0.05)
+        shutil.rmtree(path, ignore_errors=True)
+
+    with ThreadPoolExecutor(max_workers=len(dirs) or 1) as executor:
+        list(executor.map(_remove, dirs))
 
 
 def test_server_pattern_recommended(cleanup_test_dirs):
@@ -139,8 +146,9 @@ def test_server_thread_safety(cleanup_test_dirs):
 
     with db.transaction():
         db.command("sql", "CREATE DOCUMENT TYPE Item")
-        for i in range(20):
-            db.command("sql", f"INSERT INTO Item SET id = {i}, value = {i * 10}")
+        # One multi-row INSERT: a single parse and JVM call for all 20 items
+        values = ", ".join(f"({i}, {i * 10})" for i in range(20))
+        db.command("sql", f"INSERT INTO Item (id, value) VALUES {values}")
 
     print("   ✅ Created 20 items")
 
@@ -158,10 +166,10 @@ def test_server_thread_safety(cleanup_test_dirs):
             result = db.query(
                 "sql", f"SELECT FROM Item WHERE id >= {start} AND id < {end}"
             )
-            count = len(list(result))
-            results.append(f"   Thread {thread_id}: Found {count} items")
+            count = sum(1 for _ in result)
+            results.append((thread_id, count))
         except Exception as e:
-            errors.append(f"   Thread {thread_id}: Error - {e}")
+            errors.append((thread_id, e))
 
     threads = []
     for i in range(5):
@@ -172,12 +180,13 @@ def test_server_thread_safety(cleanup_test_dirs):
     for thread in threads:
         thread.join()
 
-    for result_msg in results:
-        print(result_msg)
+    # Threads only record outcomes; all output happens after join()
+    for thread_id, count in results:
+        print(f"   Thread {thread_id}: Found {count} items")
 
     if errors:
-        for error_msg in errors:
-            print(error_msg)
+        for thread_id, e in errors:
+            print(f"   Thread {thread_id}: Error - {e}")
         pytest.fail("Concurrent thread access failed")
 
     print("   ✅ All threads accessed database successfully!")
@@ -266,9 +275,9 @@ def test_pattern1_embedded_first_requires_close(cleanup_test_dirs):
     os.makedirs(server_db_dir, exist_ok=True)
     server_db_path = os.path.join(server_db_dir, db_name)
 
-    if os.path.exists(server_db_path):
-        shutil.rmtree(server_db_path)
-    shutil.move(db_path, server_db_path)
+    # Both paths live under root_path, so a single atomic rename suffices
+    shutil.rmtree(server_db_path, ignore_errors=True)
+    os.replace(db_path, server_db_path)
     print(f"   ✅ Database moved to {server_db_path}")
 
     # Step 4: Start server
@@ -346,33 +355,37 @@ def test_embedded_performance_comparison(cleanup_test_dirs):
     import random
     from datetime import datetime, timedelta
 
-    with db_standalone.transaction():
-
-        for i in range(num_records):
-            category = categories[i % len(categories)]
-            price = round(random.uniform(10.0, 999.99), 2)
-            created_date = datetime.now() - timedelta(days=random.randint(0, 365))
-            is_active = random.choice([True, False])
-            tags = ",".join(
-                random.choices(["new", "sale", "popular", "limited", "premium"], k=2)
-            )
+    chunk_size = 100  # Rows per multi-row INSERT statement
+
+    def insert_records(db):
+        """Insert num_records rows, chunk_size rows per INSERT statement."""
+        for base in range(0, num_records, chunk_size):
+            rows = []
+            for i in range(base, min(base + chunk_size, num_records)):
+                category = categories[i % len(categories)]
+                price = round(random.uniform(10.0, 999.99), 2)
+                created_date = datetime.now() - timedelta(days=random.randint(0, 365))
+                is_active = random.choice([True, False])
+                tags = ",".join(
+                    random.choices(
+                        ["new", "sale", "popular", "limited", "premium"], k=2
+                    )
+                )
+                rows.append(
+                    f"({i}, 'Product {i}', 'Product {i} with detailed description', "
+                    f"{price}, '{category}', '{tags}', "
+                    f"'{created_date.strftime('%Y-%m-%d')}', "
+                    f"{str(is_active).lower()})"
+                )
 
-            db_standalone.command(
+            db.command(
                 "sql",
-                f"""
-                INSERT INTO PerfTest SET
-                    id = {i},
-                    name = 'Product {i}',
-                    description = 'Product {i} with detailed description',
-                    price = {price},
-                    category = '{category}',
-                    tags = '{tags}',
-                    created_date = '{created_date.strftime('%Y-%m-%d')}',
-                    is_active = {str(is_active).lower()}
-            """,
+                "INSERT INTO PerfTest (id, name, description, price, category, "
+                "tags, created_date, is_active) VALUES " + ", ".join(rows),
             )
 
-    print(f"   ✅ Created {num_records} complex records")
+    with db_standalone.transaction():
+        insert_records(db_standalone)
 
     # Time standalone queries with complex operations
     import time
@@ -384,14 +397,23 @@ def test_embedded_performance_comparison(cleanup_test_dirs):
         "SELECT FROM PerfTest WHERE tags LIKE '%sale%' ORDER BY created_date DESC",
         "SELECT FROM PerfTest WHERE id BETWEEN 100 AND 200 AND price < 500",
     ]
+    # The bindings have no prepared-statement API. ArcadeDB caches parsed
+    # statements by SQL text, and the warm-up runs every query text twice, so
+    # the timed loops measure cached plans, not parsing
+    num_warmup = 2 * len(query_types)
 
-    start = time.time()
+    for i in range(num_warmup):  # Untimed: JIT and page cache warm-up
+        deque(db_standalone.query("sql", query_types[i % len(query_types)]), maxlen=0)
+
+    start = time.perf_counter_ns()
     for i in range(num_queries):
         query = query_types[i % len(query_types)]
         result = db_standalone.query("sql", query)
-        list(result)  # Consume results
-    standalone_time = time.time() - start
+        deque(result, maxlen=0)  # Consume results without keeping them
+    standalone_time = (time.perf_counter_ns() - start) / 1e9
 
+    # Reported after timing so no stdout writes land in the measured loop
+    print(f"   ✅ Created {num_records} complex records")
     print(f"   ⚡ {num_queries} complex queries in {standalone_time:.3f}s")
     print(f"   ⚡ {num_queries/standalone_time:.1f} queries/sec")
 
@@ -411,40 +433,20 @@ def test_embedded_performance_comparison(cleanup_test_dirs):
     db_server.command("sql", "CREATE DOCUMENT TYPE PerfTest")
 
     with db_server.transaction():
-        for i in range(num_records):
-            category = categories[i % len(categories)]
-            price = round(random.uniform(10.0, 999.99), 2)
-            created_date = datetime.now() - timedelta(days=random.randint(0, 365))
-            is_active = random.choice([True, False])
-            tags = ",".join(
-                random.choices(["new", "sale", "popular", "limited", "premium"], k=2)
-            )
-
-            db_server.command(
-                "sql",
-                f"""
-                INSERT INTO PerfTest SET
-                    id = {i},
-                    name = 'Product {i}',
-                    description = 'Product {i} with detailed description',
-                    price = {price},
-                    category = '{category}',
-                    tags = '{tags}',
-                    created_date = '{created_date.strftime('%Y-%m-%d')}',
-                    is_active = {str(is_active).lower()}
-            """,
-            )
-
-    print(f"   ✅ Created {num_records} complex records")
+        insert_records(db_server)
 
     # Time server-managed queries (embedded access) - same complex queries
-    start = time.time()
+    for i in range(num_warmup):  # Untimed: JIT and page cache warm-up
+        deque(db_server.query("sql", query_types[i % len(query_types)]), maxlen=0)
+
+    start = time.perf_counter_ns()
     for i in range(num_queries):
         query = query_types[i % len(query_types)]
         result = db_server.query("sql", query)
-        list(result)  # Consume results
-    server_time = time.time() - start
+        deque(result, maxlen=0)  # Consume results without keeping them
+    server_time = (time.perf_counter_ns() - start) / 1e9
 
+    print(f"   ✅ Created {num_records} complex records")
     print(f"   ⚡ {num_queries} complex queries in {server_time:.3f}s")
     print(f"   ⚡ {num_queries/server_time:.1f} queries/sec")
 
@@ -465,6 +467,7 @@ def test_embedded_performance_comparison(cleanup_test_dirs):
     print("   💡 NO HTTP overhead when accessing from same process")
     print("   💡 HTTP is only for OTHER processes/clients")
     print("   💡 HTTP would add ~5-50ms per request (network + JSON)")
+    print("   💡 Timings are end-to-end: cached plan + execution + result reads")
 
     server.stop()
     print("\n✅ Performance Test Complete!\n")